@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(ROOT, "etl_cli.py")
+
+# Budget for what etl_cli.py itself adds on top of a bare interpreter start when there is
+# nothing to process. Interpreter and `site` startup (e.g. .pth files of installed packages)
+# depend on the host, so they are measured separately and not counted against it.
+NO_OP_BUDGET_MS = 100
+RUNS = 15
+
+TRACKING_FILES = {
+    "task_1": "processed_files_task_one.json",
+    "task_2": "processed_files_task_two.json",
+}
+
+
+def time_commands(cases, cwd, runs=RUNS):
+    """
+    Runs every command `runs` times, interleaved round by round so that load changes on the
+    host affect all of them alike. Returns {name: (best, median)} wall time in milliseconds.
+    """
+    timings = {name: [] for name, _ in cases}
+    for _ in range(runs):
+        for name, args in cases:
+            start = time.perf_counter()
+            subprocess.run(args, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+            timings[name].append((time.perf_counter() - start) * 1000)
+    return {name: (min(values), statistics.median(values)) for name, values in timings.items()}
+
+
+def run_benchmark():
+    """
+    Compares the no-op path of etl_cli.py (input already processed) with a bare
+    interpreter start and with the imports every run paid before (pandas, requests, SQLAlchemy).
+
+    Returns True if the CLI's overhead above the bare interpreter stays within
+    NO_OP_BUDGET_MS for every target.
+    """
+    work_dir = tempfile.mkdtemp(prefix="etl_startup_")
+    try:
+        csv_file = os.path.join(work_dir, "sales.csv")
+        shutil.copy(os.path.join(ROOT, "task_1", "test_data.csv"), csv_file)
+        for tracking_file in TRACKING_FILES.values():
+            with open(os.path.join(work_dir, tracking_file), "w") as f:
+                json.dump({"sales.csv": os.path.getmtime(csv_file)}, f)
+
+        interpreter = "python (bare interpreter)"
+        cases = [(interpreter, [sys.executable, "-c", "pass"])]
+        for target in TRACKING_FILES:
+            cases.append((f"etl_cli.py {target} (no-op)", [sys.executable, CLI, target, "--csv", csv_file]))
+        cases.append(("import pandas, requests, sqlalchemy",
+                      [sys.executable, "-c", "import pandas, requests, sqlalchemy"]))
+
+        results = time_commands(cases, work_dir)
+        print(f"{'command':<38}{'best ms':>10}{'median ms':>11}{'overhead ms':>13}")
+        for name, _ in cases:
+            best, median = results[name]
+            print(f"{name:<38}{best:>10.1f}{median:>11.1f}{median - results[interpreter][1]:>13.1f}")
+
+        ok = True
+        for target in TRACKING_FILES:
+            overhead = results[f"etl_cli.py {target} (no-op)"][1] - results[interpreter][1]
+            within = overhead < NO_OP_BUDGET_MS
+            ok = ok and within
+            print(f"{target}: no-op overhead {overhead:.1f} ms above interpreter start, "
+                  f"budget {NO_OP_BUDGET_MS} ms: {'OK' if within else 'EXCEEDED'}")
+        return ok
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)
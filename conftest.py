@@ -0,0 +1,47 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# run_script imports its siblings by plain module name, as when it is run as a script
+FLAT_MODULES = ("run_script", "check_files", "clean_data", "fetch_data", "load_data", "pipeline")
+
+
+def fake_rates(date_str):
+    """
+    Stand-in for fetch_rates_for_date, so tests never call the Frankfurter API.
+    """
+    return [
+        {"date": date_str, "currency": "EUR", "rate": 0.9},
+        {"date": date_str, "currency": "GBP", "rate": 0.8},
+        {"date": date_str, "currency": "USD", "rate": 1},
+    ]
+
+
+@pytest.fixture(name="fake_rates")
+def fake_rates_fixture():
+    return fake_rates
+
+
+@pytest.fixture
+def import_run_script(tmp_path, monkeypatch):
+    """
+    Returns a function that imports run_script from a task directory (e.g. "task_1"),
+    with its rate fetching replaced by fake_rates. The test runs from tmp_path, so
+    etl.log, pickles and the tracking file end up there.
+    """
+    monkeypatch.chdir(tmp_path)
+
+    def load(task_dir):
+        monkeypatch.syspath_prepend(os.path.join(ROOT, task_dir))
+        for name in FLAT_MODULES:
+            monkeypatch.delitem(sys.modules, name, raising=False)
+        module = importlib.import_module("run_script")
+        monkeypatch.setattr(module, "fetch_rates_for_date", fake_rates)
+        return module
+
+    yield load
+    for name in FLAT_MODULES:
+        sys.modules.pop(name, None)
@@ -0,0 +1,69 @@
+import argparse
+import importlib
+import logging
+import os
+import sys
+
+from dotenv import load_dotenv
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Target -> directory with its ETL modules and env variable with its SQLite database
+TARGETS = {
+    "task_1": (os.path.join(ROOT, "task_1"), "SQLITE_DB_PATH_ONE"),
+    "task_2": (os.path.join(ROOT, "task_2", "save_data"), "SQLITE_DB_PATH_TWO"),
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the sales ETL for one target if there is new data.")
+    parser.add_argument("target", choices=sorted(TARGETS), help="ETL target to run")
+    parser.add_argument("--csv", default=None, help="sales file to process (default: $CSV_DATA)")
+    parser.add_argument("--db", default=None, help="SQLite database (default: the target's env variable)")
+    parser.add_argument("--chunksize", type=int, default=None, help="rows handled per chunk")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Runs the ETL for the chosen target and returns the process exit code.
+
+    Returns 0 when the file was processed or had already been processed,
+    1 when no sales file is configured, it does not exist or the ETL failed.
+    """
+    args = parse_args(argv)
+    load_dotenv()
+    module_dir, db_env = TARGETS[args.target]
+    csv_file = args.csv or os.getenv("CSV_DATA")
+    db = args.db or os.getenv(db_env)
+
+    logging.basicConfig(
+        filename="etl.log",
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+    if not csv_file or not os.path.exists(csv_file):
+        logging.error("Sales file not found: %s", csv_file)
+        print(f"Sales file not found: {csv_file}")
+        return 1
+
+    # The ETL modules import each other by plain module name (as when running run_script.py)
+    sys.path.insert(0, module_dir)
+    check_files = importlib.import_module("check_files")
+    if check_files.is_already_processed(csv_file):
+        logging.info("File %s already processed. Skipping.", csv_file)
+        print(f"File {csv_file} has already been processed. Skipping.")
+        return 0
+
+    # Only now pay for pandas, requests and the database drivers
+    run_script = importlib.import_module("run_script")
+    kwargs = {"chunksize": args.chunksize} if args.chunksize else {}
+    if not run_script.run_etl(csv_file, db, os.getenv("POSTGRES_URL"), **kwargs):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
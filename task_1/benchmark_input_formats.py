@@ -0,0 +1,112 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from fetch_data import fetch_csv_data
+from pipeline import CHUNK_SIZE
+
+# Number of synthetic sales rows written for the benchmark
+DEFAULT_ROWS = 500_000
+
+
+
+def stream_writer(opener):
+    """
+    Returns a writer that compresses a file with a file-like opener (gzip.open, ...).
+    """
+    def write(source_file, target_file):
+        with open(source_file, "rb") as src, opener(target_file, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+    return write
+
+
+def write_zip(source_file, target_file):
+    """
+    Writes a zip archive holding the CSV as its single member, as pandas expects.
+    """
+    with zipfile.ZipFile(target_file, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.write(source_file, arcname="sales.csv")
+
+
+# Format -> function writing the plain CSV in that format (None: the plain CSV itself)
+WRITERS = {
+    "csv": None,
+    "csv.gz": stream_writer(gzip.open),
+    "csv.bz2": stream_writer(bz2.open),
+    "csv.xz": stream_writer(lzma.open),
+    "csv.zip": write_zip,
+}
+
+# pandas reads .zst files only when the optional zstandard package is installed
+try:
+    import zstandard
+except ImportError:
+    pass
+else:
+    WRITERS["csv.zst"] = stream_writer(zstandard.open)
+
+
+def make_sales_file(path, rows):
+    """
+    Writes a synthetic sales CSV with the same columns as test_data.csv.
+    """
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame({
+        "order_id": np.arange(rows),
+        "affiliate_name": rng.choice(["John Doe", "Jane Smith", "Alice Brown", "Bob White"], rows),
+        "sales_amount": rng.uniform(10, 500, rows).round(2),
+        "currency": rng.choice(["USD", "EUR", "GBP"], rows),
+        "order_date": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        "category": rng.choice(["Electronics", "Fashion", "Health"], rows),
+    })
+    df.to_csv(path, index=False)
+
+
+def benchmark(sales_file, chunksize=CHUNK_SIZE):
+    """
+    Reads the file in chunks through fetch_csv_data and returns (rows, seconds).
+    """
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in fetch_csv_data(sales_file, chunksize=chunksize))
+    return rows, time.perf_counter() - start
+
+
+def run_benchmark(rows=DEFAULT_ROWS):
+    """
+    Reports extract throughput for every supported input format.
+
+    Throughput is given both for the CSV data produced (MB/s uncompressed)
+    and for the bytes actually read from disk (MB/s on disk).
+    """
+    work_dir = tempfile.mkdtemp(prefix="etl_bench_")
+    try:
+        plain_file = os.path.join(work_dir, "sales.csv")
+        make_sales_file(plain_file, rows)
+        csv_mb = os.path.getsize(plain_file) / 1e6
+
+        print(f"{'format':<10}{'rows':>10}{'disk MB':>10}{'seconds':>10}{'MB/s':>10}{'disk MB/s':>11}")
+        for fmt, writer in WRITERS.items():
+            sales_file = os.path.join(work_dir, f"sales.{fmt}")
+            if writer is not None:
+                writer(plain_file, sales_file)
+            disk_mb = os.path.getsize(sales_file) / 1e6
+            rows_read, seconds = benchmark(sales_file)
+            print(
+                f"{fmt:<10}{rows_read:>10}{disk_mb:>10.1f}{seconds:>10.2f}"
+                f"{csv_mb / seconds:>10.1f}{disk_mb / seconds:>11.1f}"
+            )
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
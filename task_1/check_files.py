@@ -10,6 +10,8 @@ def is_already_processed(file_path):
 
     It does so by comparing the last modified timestamp of the file
     against the stored metadata in `processed_files.json`.
+    Compressed exports (.gz, .bz2, .xz, .zip, .zst) are tracked by their own name and
+    timestamp, so they never have to be decompressed just to be checked.
 
     Returns:
         True if the file exists in the tracking file and has not changed since last run.
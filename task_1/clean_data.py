@@ -1,3 +1,4 @@
+import glob
 import os
 
 import pandas as pd
@@ -6,10 +7,13 @@ PICKLE_FOLDER = "pickles"
 
 
 # --- Save the data in pickle format for quick inspection and backup ---
-def save_pickle(df, source_file):
+def save_pickle(df, source_file, part=None):
     """
     Saves the cleaned DataFrame to a .pkl file.
 
+    Files processed in one go are saved as `<file>.pkl`. Chunked runs save every
+    chunk as `<file>.partNNNNN.pkl` (see clear_pickle_parts).
+
     Why pickle?
     - Stores the full DataFrame including all column types and structure.
     - Much faster to read/write compared to CSV or Excel.
@@ -17,14 +21,26 @@ def save_pickle(df, source_file):
     - Compressed by default, takes less disk space.
     """
     os.makedirs(PICKLE_FOLDER, exist_ok=True)
-    pickle_path = os.path.join(PICKLE_FOLDER, f"{os.path.basename(source_file)}.pkl")
+    suffix = ".pkl" if part is None else f".part{part:05d}.pkl"
+    pickle_path = os.path.join(PICKLE_FOLDER, f"{os.path.basename(source_file)}{suffix}")
     df.to_pickle(pickle_path)
 
 
+def clear_pickle_parts(source_file):
+    """
+    Removes the chunk pickles of an earlier run of `source_file`, so that after a chunked
+    run `pickles/` holds exactly the parts of that run (a larger earlier run would
+    otherwise leave stale trailing parts behind).
+    """
+    pattern = os.path.join(PICKLE_FOLDER, f"{glob.escape(os.path.basename(source_file))}.part*.pkl")
+    for pickle_path in glob.glob(pattern):
+        os.remove(pickle_path)
+
+
 # --- Transform the data ---
-def clean_sales_data(df, csv_file, rates):
+def clean_sales_data(df, csv_file, rates, part=None):
     """
-    Cleans and transforms the raw sales DataFrame:
+    Cleans and transforms the raw sales DataFrame (or chunk `part` of it):
     - Converts types (sales_amount to numeric, order_date to datetime)
     - Saves raw parsed data to pickle for inspection/debugging
     - Drops rows with missing critical fields
@@ -36,7 +52,7 @@ def clean_sales_data(df, csv_file, rates):
     df["sales_amount"] = pd.to_numeric(df["sales_amount"], errors="coerce")
     df["order_date"] = pd.to_datetime(df["order_date"], errors="coerce")
 
-    save_pickle(df, csv_file)
+    save_pickle(df, csv_file, part)
 
     df = df.dropna(subset=["sales_amount", "order_date", "currency"]).copy()
     df["affiliate_name"] = df["affiliate_name"].fillna("Unknown Affiliate")
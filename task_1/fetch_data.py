@@ -3,17 +3,27 @@ import requests
 
 
 # --- Extract data---
-def fetch_csv_data(sales_file):
+def fetch_csv_data(sales_file, chunksize=None):
     """
     Loads sales data from a CSV file into a Pandas DataFrame.
 
+    The file is memory mapped instead of read through buffered I/O. Compressed files
+    (.gz, .bz2, .xz, .zip, .zst, inferred by pandas from the extension) are decompressed
+    from the mapping on the fly, also when read in chunks.
+
     Args:
-        sales_file (str): Path to the sales CSV file.
+        sales_file (str): Path to the sales CSV file, optionally compressed.
+        chunksize (int, optional): If given, the file is read lazily in chunks of this many rows.
 
     Returns:
-        pd.DataFrame: Raw sales data.
+        pd.DataFrame: Raw sales data, or an iterator of DataFrames when chunksize is set.
     """
-    df = pd.read_csv(sales_file)
+    df = pd.read_csv(
+        sales_file,
+        chunksize=chunksize,
+        compression="infer",
+        memory_map=True
+    )
     return df
 
 
@@ -29,20 +39,31 @@ def fetch_exchange_rates(df):
     rate_records = []
 
     for date_str in unique_dates:
-        api_url = f"https://api.frankfurter.app/{date_str}?from=USD"
-        response = requests.get(api_url)
-        response.raise_for_status()
-        data = response.json()
-        for currency, rate in data["rates"].items():
-            rate_records.append({
-                "date": date_str,
-                "currency": currency,
-                "rate": rate
-            })
+        rate_records.extend(fetch_rates_for_date(date_str))
+
+    return pd.DataFrame(rate_records)
+
+
+def fetch_rates_for_date(date_str):
+    """
+    Fetches exchange rates vs USD from Frankfurter API for a single date.
+    Returns a list of records with keys: date, currency, rate (USD itself included with rate 1).
+    """
+    api_url = f"https://api.frankfurter.app/{date_str}?from=USD"
+    response = requests.get(api_url)
+    response.raise_for_status()
+    data = response.json()
+
+    rate_records = []
+    for currency, rate in data["rates"].items():
         rate_records.append({
             "date": date_str,
-            "currency": "USD",
-            "rate": 1
+            "currency": currency,
+            "rate": rate
         })
-
-    return pd.DataFrame(rate_records)
+    rate_records.append({
+        "date": date_str,
+        "currency": "USD",
+        "rate": 1
+    })
+    return rate_records
@@ -0,0 +1,211 @@
+import logging
+import queue
+import threading
+import time
+
+import pandas as pd
+
+# Rows per chunk read from the sales file
+CHUNK_SIZE = 50_000
+# Chunks allowed to wait between two stages before the faster one blocks (back-pressure)
+QUEUE_SIZE = 4
+
+_DONE = object()
+
+
+class StageStats:
+    """
+    Keeps track of how long a pipeline stage spent doing actual work,
+    as opposed to waiting on its input or output queue.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.busy_seconds = 0.0
+        self.items = 0
+
+    def utilization(self, wall_seconds):
+        """Share of the pipeline wall time (0..1) this stage was busy."""
+        if wall_seconds <= 0:
+            return 0.0
+        return min(self.busy_seconds / wall_seconds, 1.0)
+
+
+class _RateCache:
+    """
+    Exchange rate records per date, filled by the rate stage and read by the transform stage.
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._cond = threading.Condition()
+
+    def put(self, date_str, records):
+        with self._cond:
+            self._records[date_str] = records
+            self._cond.notify_all()
+
+    def wait_for(self, dates, stop):
+        """
+        Blocks until the rates of all `dates` are available and returns them as a DataFrame
+        with columns: date, currency, rate. Returns None if the pipeline was stopped meanwhile.
+        """
+        with self._cond:
+            while not all(d in self._records for d in dates):
+                if stop.is_set():
+                    return None
+                self._cond.wait(timeout=0.1)
+            records = [record for d in dates for record in self._records[d]]
+        return pd.DataFrame(records, columns=["date", "currency", "rate"])
+
+
+def _put(q, item, stop):
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q, stop):
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _chunk_dates(chunk):
+    dates = pd.to_datetime(chunk["order_date"], errors="coerce").dropna()
+    return sorted(dates.dt.strftime('%Y-%m-%d').unique())
+
+
+def run_pipeline(chunks, fetch_rates, transform, load, queue_size=QUEUE_SIZE):
+    """
+    Runs the ETL as a producer/consumer pipeline of worker threads connected by bounded queues,
+    so that chunk N+1 is parsed while chunk N is converted and chunk N-1 is written.
+
+    Stages:
+    - parse: pulls raw chunks from `chunks` and hands every newly seen order date to the rate stage.
+    - rates: fetches exchange rates for a date as soon as it is seen, not after the whole file is parsed.
+    - transform: waits for the rates of the chunk's dates and cleans/converts the chunk.
+    - load: writes the converted chunks in file order.
+
+    Once `queue_size` chunks are waiting for the next stage the faster stage blocks, which keeps
+    memory bounded by the chunk size (plus the rate records of each distinct order date).
+    Duplicates are only dropped within a chunk; removing rows repeated across chunks is left
+    to the load stage (e.g. a primary key or a DISTINCT pass in the database).
+
+    Args:
+        chunks (iterable): Raw sales DataFrames, e.g. fetch_csv_data(path, chunksize=CHUNK_SIZE).
+        fetch_rates (callable): fetch_rates(date_str) -> list of {date, currency, rate} records.
+        transform (callable): transform(chunk, index, rates) -> cleaned DataFrame.
+        load (callable): load(df_clean, index, rates), called once per chunk, in order.
+        queue_size (int): Maximum number of chunks buffered between two stages.
+
+    Returns:
+        dict: Stage name -> utilization, the share of wall time (0..1) the stage was busy.
+
+    Raises:
+        The first exception raised by any of the stages; the other stages are stopped.
+    """
+    stats = {name: StageStats(name) for name in ("parse", "rates", "transform", "load")}
+    dates_q = queue.Queue()
+    transform_q = queue.Queue(maxsize=queue_size)
+    load_q = queue.Queue(maxsize=queue_size)
+    rate_cache = _RateCache()
+    stop = threading.Event()
+    errors = []
+
+    def parse():
+        seen_dates = set()
+        chunk_iter = iter(chunks)
+        index = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            chunk = next(chunk_iter, _DONE)
+            if chunk is _DONE:
+                break
+            dates = _chunk_dates(chunk)
+            for date_str in dates:
+                if date_str not in seen_dates:
+                    seen_dates.add(date_str)
+                    dates_q.put(date_str)
+            stats["parse"].busy_seconds += time.perf_counter() - start
+            stats["parse"].items += 1
+            if not _put(transform_q, (index, chunk, dates), stop):
+                return
+            index += 1
+        dates_q.put(_DONE)
+        _put(transform_q, _DONE, stop)
+
+    def rates():
+        while True:
+            date_str = _get(dates_q, stop)
+            if date_str is _DONE:
+                return
+            start = time.perf_counter()
+            rate_cache.put(date_str, fetch_rates(date_str))
+            stats["rates"].busy_seconds += time.perf_counter() - start
+            stats["rates"].items += 1
+
+    def convert():
+        while True:
+            item = _get(transform_q, stop)
+            if item is _DONE:
+                break
+            index, chunk, dates = item
+            chunk_rates = rate_cache.wait_for(dates, stop)
+            if chunk_rates is None:
+                return
+            start = time.perf_counter()
+            df_clean = transform(chunk, index, chunk_rates)
+            stats["transform"].busy_seconds += time.perf_counter() - start
+            stats["transform"].items += 1
+            if not _put(load_q, (index, df_clean, chunk_rates), stop):
+                return
+        _put(load_q, _DONE, stop)
+
+    def write():
+        while True:
+            item = _get(load_q, stop)
+            if item is _DONE:
+                return
+            index, df_clean, chunk_rates = item
+            start = time.perf_counter()
+            load(df_clean, index, chunk_rates)
+            stats["load"].busy_seconds += time.perf_counter() - start
+            stats["load"].items += 1
+
+    def guarded(target):
+        def run():
+            try:
+                target()
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+        return run
+
+    wall_start = time.perf_counter()
+    threads = [
+        threading.Thread(target=guarded(target), name=f"etl-{name}", daemon=True)
+        for name, target in (("parse", parse), ("rates", rates), ("transform", convert), ("load", write))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_seconds = time.perf_counter() - wall_start
+
+    if errors:
+        raise errors[0]
+
+    for stage in stats.values():
+        logging.info(
+            "Stage %-9s %4d items, busy %.2fs, utilization %.0f%%",
+            stage.name, stage.items, stage.busy_seconds, 100 * stage.utilization(wall_seconds)
+        )
+    return {name: stage.utilization(wall_seconds) for name, stage in stats.items()}
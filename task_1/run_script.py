@@ -1,10 +1,12 @@
 import os
+import sys
 from dotenv import load_dotenv
 
-from fetch_data import fetch_csv_data, fetch_exchange_rates
+from fetch_data import fetch_csv_data, fetch_rates_for_date
 from check_files import mark_as_processed, is_already_processed
-from clean_data import clean_sales_data
-from load_data import load_to_sqlite, load_to_postgres
+from clean_data import clean_sales_data, clear_pickle_parts
+from load_data import load_to_sqlite, load_to_postgres, promote_staging_table, promote_staging_table_postgres
+from pipeline import run_pipeline, CHUNK_SIZE
 
 import logging
 
@@ -17,24 +19,33 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
+# Chunks are loaded here and swapped in as `sales` only once the whole file made it
+STAGING_TABLE = "sales_staging"
 
-def run_etl(csv_file, db, conn_str):
+
+def run_etl(csv_file, db, conn_str, chunksize=CHUNK_SIZE):
     """
     Executes the full ETL (Extract, Transform, Load) process.
 
     Steps:
     1. Checks if the file has already been processed using its last modified timestamp.
-    2. Extracts sales data and exchange rates.
-    3. Cleans and transforms the sales data.
-    4. Loads the cleaned data into a SQLite database.
+    2. Extracts sales data in chunks and fetches exchange rates for every new date seen.
+    3. Cleans and transforms each chunk.
+    4. Loads the cleaned chunks into a staging table and swaps it in as `sales` at the end,
+       removing rows repeated across chunks.
     5. Optionally loads the data into a PostgreSQL database.
     6. Marks the file as processed to avoid reprocessing in the future.
 
+    Steps 2-5 overlap: they run as a pipeline (see pipeline.run_pipeline).
+
     Args:
         csv_file (str): Path to the sales CSV file.
-        api_url (str): URL for exchange rate API.
         db (str): Path to the SQLite database file.
         conn_str (str): SQLAlchemy connection string for PostgreSQL.
+        chunksize (int): Number of rows handled per chunk.
+
+    Returns:
+        bool: True if the file was processed (or had been already), False if the ETL failed.
     """
     print("Running ETL...")
     logging.info("Starting ETL for file: %s", csv_file)
@@ -42,21 +53,33 @@ def run_etl(csv_file, db, conn_str):
         if is_already_processed(csv_file):
             logging.info("File %s already processed. Skipping.", csv_file)
             print(f"File {csv_file} has already been processed. Skipping.")
-            return
-        df = fetch_csv_data(csv_file)
-        rates = fetch_exchange_rates(df)
-        df_clean = clean_sales_data(df, csv_file, rates)
-        load_to_sqlite(df_clean, db)
+            return True
+
+        def transform(chunk, index, rates):
+            return clean_sales_data(chunk, csv_file, rates, part=index)
+
+        def load(df_clean, index, rates):
+            load_to_sqlite(df_clean, db, STAGING_TABLE, if_exists="replace" if index == 0 else "append")
+
+            #TODO To enable PostgreSQL instead of SQLite, uncomment the line below and the
+            # promote_staging_table_postgres call after the pipeline:
+            # load_to_postgres(df_clean, conn_str, STAGING_TABLE, if_exists="replace" if index == 0 else "append")
 
-        #TODO To enable PostgreSQL instead of SQLite, uncomment the line below:
-        # load_to_postgres(df_clean, conn_str)
+        clear_pickle_parts(csv_file)
+        with fetch_csv_data(csv_file, chunksize=chunksize) as chunks:
+            utilization = run_pipeline(chunks, fetch_rates_for_date, transform, load)
+        promote_staging_table(db, STAGING_TABLE)
+        # promote_staging_table_postgres(conn_str, STAGING_TABLE)
+        print("Stage utilization: " + ", ".join(f"{name} {share:.0%}" for name, share in utilization.items()))
 
         mark_as_processed(csv_file)
         logging.info("ETL completed successfully for file: %s", csv_file)
         print("ETL completed successfully.")
+        return True
     except Exception as e:
         logging.error("ETL failed for file: %s with error: %s", csv_file, str(e), exc_info=True)
         print(f"ETL failed: {e}")
+        return False
 
 
 
@@ -67,4 +90,4 @@ if __name__ == "__main__":
     conn_str = os.getenv("POSTGRES_URL")
 
     # Execute the ETL process
-    run_etl(csv_data, db_file, conn_str)
+    sys.exit(0 if run_etl(csv_data, db_file, conn_str) else 1)
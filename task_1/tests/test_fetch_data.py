@@ -0,0 +1,45 @@
+import bz2
+import gzip
+import lzma
+import zipfile
+
+import pandas as pd
+import pytest
+
+from task_1 import check_files
+from task_1.fetch_data import fetch_csv_data
+
+CSV_FILE = "task_1/test_data.csv"
+
+
+def compress(source_file, target_file, codec):
+    if codec == "zip":
+        with zipfile.ZipFile(target_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(source_file, "test_data.csv")
+        return
+    opener = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}[codec]
+    with open(source_file, "rb") as src, opener(target_file, "wb") as dst:
+        dst.write(src.read())
+
+
+@pytest.mark.parametrize("extension, codec", [(".gz", "gzip"), (".bz2", "bz2"), (".xz", "xz"), (".zip", "zip")])
+def test_fetch_csv_data_compressed_matches_plain(tmp_path, extension, codec):
+    compressed_file = str(tmp_path / f"test_data.csv{extension}")
+    compress(CSV_FILE, compressed_file, codec)
+
+    expected = fetch_csv_data(CSV_FILE)
+    pd.testing.assert_frame_equal(fetch_csv_data(compressed_file), expected)
+
+    chunks = list(fetch_csv_data(compressed_file, chunksize=5))
+    assert [len(chunk) for chunk in chunks] == [5, 5, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_compressed_file_is_tracked(tmp_path, monkeypatch):
+    monkeypatch.setattr(check_files, "TRACKING_FILE", str(tmp_path / "processed.json"))
+    compressed_file = str(tmp_path / "test_data.csv.gz")
+    compress(CSV_FILE, compressed_file, "gzip")
+
+    assert not check_files.is_already_processed(compressed_file)
+    check_files.mark_as_processed(compressed_file)
+    assert check_files.is_already_processed(compressed_file)
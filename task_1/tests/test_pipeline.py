@@ -0,0 +1,117 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from task_1.clean_data import clean_sales_data
+from task_1.fetch_data import fetch_csv_data
+from task_1.load_data import load_to_sqlite
+from task_1.pipeline import run_pipeline
+
+CSV_FILE = os.path.abspath("task_1/test_data.csv")
+
+
+def run_chunked(db, chunksize, fetch_rates):
+    def transform(chunk, index, rates):
+        return clean_sales_data(chunk, CSV_FILE, rates, part=index)
+
+    def load(df_clean, index, rates):
+        load_to_sqlite(df_clean, db, if_exists="replace" if index == 0 else "append")
+
+    chunks = fetch_csv_data(CSV_FILE, chunksize=chunksize)
+    return run_pipeline(chunks, fetch_rates, transform, load, queue_size=1)
+
+
+def test_pipeline_matches_full_file(tmp_path, monkeypatch, fake_rates):
+    monkeypatch.chdir(tmp_path)
+    db = str(tmp_path / "etl.db")
+
+    utilization = run_chunked(db, chunksize=3, fetch_rates=fake_rates)
+
+    with sqlite3.connect(db) as conn:
+        loaded = pd.read_sql_query("SELECT * FROM sales ORDER BY order_id", conn)
+    assert set(loaded["order_id"]) == {101, 105, 106, 107, 108, 109, 111, 112}
+    assert loaded["sales_amount_usd"].notna().all()
+    row_101 = loaded[loaded["order_id"] == 101].iloc[0]
+    assert row_101["sales_amount_usd"] == 150 / 0.9
+
+    assert set(utilization) == {"parse", "rates", "transform", "load"}
+    assert all(0 <= share <= 1 for share in utilization.values())
+
+
+def test_pipeline_propagates_stage_errors(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def failing_rates(date_str):
+        raise RuntimeError("rates API down")
+
+    with pytest.raises(RuntimeError, match="rates API down"):
+        run_chunked(str(tmp_path / "etl.db"), chunksize=3, fetch_rates=failing_rates)
+
+
+def test_pipeline_overlaps_stages_with_back_pressure(fake_rates):
+    # (time, event, chunk index or date) for every stage, recorded from all threads
+    events = []
+    lock = threading.Lock()
+
+    def record(event, key=None):
+        with lock:
+            events.append((time.perf_counter(), event, key))
+
+    def chunks():
+        for index, chunk in enumerate(fetch_csv_data(CSV_FILE, chunksize=1)):
+            record("parsed", index)
+            yield chunk
+        record("parse_done")
+
+    def fetch_rates(date_str):
+        record("rates", date_str)
+        return fake_rates(date_str)
+
+    def transform(chunk, index, rates):
+        record("transform_start", index)
+        time.sleep(0.02)
+        record("transform_end", index)
+        return chunk
+
+    def load(df_clean, index, rates):
+        record("load_start", index)
+        time.sleep(0.05)
+        record("load_end", index)
+
+    run_pipeline(chunks(), fetch_rates, transform, load, queue_size=1)
+
+    def when(event, key=None):
+        return next(t for t, e, k in events if e == event and k == key)
+
+    def intervals(stage):
+        return {k: (t, when(f"{stage}_end", k)) for t, e, k in events if e == f"{stage}_start"}
+
+    num_chunks = 12
+    transforms, loads = intervals("transform"), intervals("load")
+    assert sorted(loads) == list(range(num_chunks))
+
+    # Rates are fetched as dates show up, long before the whole file is parsed
+    first_rates = min(t for t, e, _ in events if e == "rates")
+    assert first_rates < when("parsed", num_chunks // 2) < when("parse_done")
+
+    # While a chunk is written, later chunks are transformed and parsed at the same time
+    assert any(
+        transforms[m][0] < loads[n][1] and loads[n][0] < transforms[m][1]
+        for n in loads for m in transforms if m > n
+    )
+    assert any(
+        loads[n][0] < t < loads[n][1]
+        for n in loads for t, e, m in events if e == "parsed" and m > n + 1
+    )
+
+    # Back-pressure: with queue_size=1 at most one chunk waits in each queue, one is being
+    # transformed and one is handed over by the parser, so parsing never runs ahead of the
+    # slow load by more than that; without it, all 12 chunks would be parsed right away.
+    for n, (load_start, _) in loads.items():
+        parsed = sum(1 for t, e, _ in events if e == "parsed" and t < load_start)
+        assert parsed <= n + 5
+    assert when("parse_done") > loads[0][1]
@@ -0,0 +1,82 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+CSV_FILE = os.path.abspath(os.path.join("task_1", "test_data.csv"))
+
+
+@pytest.fixture
+def run_script(import_run_script):
+    return import_run_script("task_1")
+
+
+def write_csv_with_repeated_rows(tmp_path):
+    with open(CSV_FILE) as f:
+        lines = f.read().splitlines()
+    csv_file = tmp_path / "dupes.csv"
+    csv_file.write_text("\n".join(lines + lines[1:3]) + "\n")
+    return str(csv_file)
+
+
+def table_names(db):
+    with sqlite3.connect(db) as conn:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+
+def test_run_etl_removes_rows_repeated_across_chunks(tmp_path, run_script):
+    csv_file = write_csv_with_repeated_rows(tmp_path)
+    db = str(tmp_path / "etl.db")
+    os.makedirs("pickles")
+    stale_part = os.path.join("pickles", "dupes.csv.part00009.pkl")
+    open(stale_part, "wb").close()
+
+    assert run_script.run_etl(csv_file, db, None, chunksize=4) is True
+
+    with sqlite3.connect(db) as conn:
+        order_ids = [row[0] for row in conn.execute("SELECT order_id FROM sales ORDER BY order_id")]
+    assert order_ids == [101, 105, 106, 107, 108, 109, 111, 112]
+    assert table_names(db) == {"sales"}
+    assert sorted(os.listdir("pickles")) == [f"dupes.csv.part{i:05d}.pkl" for i in range(4)]
+
+
+def test_failed_run_keeps_previous_sales(tmp_path, run_script, monkeypatch):
+    db = str(tmp_path / "etl.db")
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE sales (order_id INTEGER)")
+        conn.execute("INSERT INTO sales VALUES (1)")
+
+    load_to_sqlite = run_script.load_to_sqlite
+
+    def fail_on_third_chunk(df, db, table_name, if_exists):
+        fail_on_third_chunk.calls += 1
+        if fail_on_third_chunk.calls == 3:
+            raise sqlite3.OperationalError("disk I/O error")
+        load_to_sqlite(df, db, table_name, if_exists=if_exists)
+
+    fail_on_third_chunk.calls = 0
+    monkeypatch.setattr(run_script, "load_to_sqlite", fail_on_third_chunk)
+
+    assert run_script.run_etl(CSV_FILE, db, None, chunksize=3) is False
+
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT order_id FROM sales").fetchall() == [(1,)]
+    assert not run_script.is_already_processed(CSV_FILE)
+
+
+def test_promote_staging_table_postgres_deduplicates_and_swaps(tmp_path, run_script):
+    # Same SQL as on PostgreSQL, run through SQLAlchemy against SQLite
+    db = tmp_path / "etl.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE sales (order_id INTEGER)")
+        conn.execute("INSERT INTO sales VALUES (1)")
+        conn.execute("CREATE TABLE sales_staging (order_id INTEGER, category TEXT)")
+        conn.executemany("INSERT INTO sales_staging VALUES (?, ?)", [(2, None), (2, None), (3, "Health")])
+
+    load_data = sys.modules["load_data"]
+    load_data.promote_staging_table_postgres(f"sqlite:///{db}", run_script.STAGING_TABLE)
+
+    with sqlite3.connect(db) as conn:
+        assert sorted(conn.execute("SELECT order_id, category FROM sales").fetchall()) == [(2, None), (3, "Health")]
+    assert table_names(str(db)) == {"sales"}
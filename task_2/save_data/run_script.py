@@ -1,13 +1,15 @@
 import os
+import sys
 from dotenv import load_dotenv
 
 import logging
 
 from check_files import mark_as_processed, is_already_processed
-from clean_data import clean_sales_data
+from clean_data import clean_sales_data, clear_pickle_parts
 from load_data import load_to_sqlite
 
-from fetch_data import fetch_csv_data, fetch_exchange_rates
+from fetch_data import fetch_csv_data, fetch_rates_for_date
+from pipeline import run_pipeline, CHUNK_SIZE
 
 load_dotenv()
 
@@ -19,25 +21,36 @@ logging.basicConfig(
 )
 
 
-def run_etl(csv_file, db, conn_str):
+def run_etl(csv_file, db, conn_str, chunksize=CHUNK_SIZE):
     print("Running ETL...")
     logging.info("Starting ETL for file: %s", csv_file)
     try:
         if is_already_processed(csv_file):
             logging.info("File %s already processed. Skipping.", csv_file)
             print(f"File {csv_file} has already been processed. Skipping.")
-            return
-        df = fetch_csv_data(csv_file)
-        rates = fetch_exchange_rates(df)
-        df_clean = clean_sales_data(df, csv_file, rates)
+            return True
+
+        def transform(chunk, index, rates):
+            return clean_sales_data(chunk, csv_file, rates, part=index)
+
+        # INSERT OR IGNORE on the order_id primary key skips rows repeated across chunks,
+        # and re-running a file after a failed run only adds the missing rows.
+        def load(df_clean, index, rates):
+            load_to_sqlite(df_clean, db, rates)
+
+        clear_pickle_parts(csv_file)
+        with fetch_csv_data(csv_file, chunksize=chunksize) as chunks:
+            utilization = run_pipeline(chunks, fetch_rates_for_date, transform, load)
+        print("Stage utilization: " + ", ".join(f"{name} {share:.0%}" for name, share in utilization.items()))
 
-        load_to_sqlite(df_clean, db, rates)
         mark_as_processed(csv_file)
         logging.info("ETL completed successfully for file: %s", csv_file)
         print("ETL completed successfully.")
+        return True
     except Exception as e:
         logging.error("ETL failed for file: %s with error: %s", csv_file, str(e), exc_info=True)
         print(f"ETL failed: {e}")
+        return False
 
 
 if __name__ == "__main__":
@@ -48,4 +61,4 @@ if __name__ == "__main__":
     conn_str = os.getenv("POSTGRES_URL")
 
     # Execute the ETL process
-    run_etl(csv_data, db_file, conn_str)
+    sys.exit(0 if run_etl(csv_data, db_file, conn_str) else 1)
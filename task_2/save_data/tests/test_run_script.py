@@ -0,0 +1,43 @@
+import os
+import runpy
+import sqlite3
+
+import pytest
+
+CREATE_DB_SCRIPT = os.path.abspath(os.path.join("task_2", "create_db_script.py"))
+CSV_FILE = os.path.abspath(os.path.join("task_1", "test_data.csv"))
+
+
+@pytest.fixture
+def run_script(import_run_script):
+    return import_run_script(os.path.join("task_2", "save_data"))
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    db = str(tmp_path / "task_two_etl.db")
+    monkeypatch.setenv("SQLITE_DB_PATH_TWO", db)
+    runpy.run_path(CREATE_DB_SCRIPT)
+    return db
+
+
+def test_run_etl_loads_every_chunk_with_its_rates(tmp_path, run_script, db):
+    with open(CSV_FILE) as f:
+        lines = f.read().splitlines()
+    csv_file = tmp_path / "dupes.csv"
+    csv_file.write_text("\n".join(lines + lines[1:3]) + "\n")
+
+    assert run_script.run_etl(str(csv_file), db, None, chunksize=4) is True
+
+    with sqlite3.connect(db) as conn:
+        sales = conn.execute("""
+            SELECT s.order_id, s.sales_amount / er.rate
+            FROM sales s JOIN exchange_rates er ON s.exchange_rate_id = er.id
+            ORDER BY s.order_id
+        """).fetchall()
+        rate_dates = conn.execute("SELECT COUNT(DISTINCT date) FROM exchange_rates").fetchone()[0]
+    assert [order_id for order_id, _ in sales] == [101, 105, 106, 107, 108, 109, 111, 112]
+    assert dict(sales)[101] == 150 / 0.9
+    # One date per row with a valid order_date in the file
+    assert rate_dates == 11
+    assert run_script.is_already_processed(str(csv_file))
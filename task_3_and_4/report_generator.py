@@ -1,4 +1,6 @@
+import argparse
 import os
+import random
 import sqlite3
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -15,95 +17,105 @@ REPORT_FOLDER = "reports"
 os.makedirs(REPORT_FOLDER, exist_ok=True)
 DB_PATH = os.getenv("SQLITE_DB_PATH_TWO")
 
-# 1. Connect to DB
-conn = sqlite3.connect(DB_PATH)
+# Quick-look mode: rows sampled, rowid strata they are spread over,
+# z-value of the reported error bounds (95%) and number of top affiliates listed
+QUICK_SAMPLE_SIZE = 20_000
+QUICK_STRATA = 50
+QUICK_Z = 1.96
+TOP_K_AFFILIATES = 10
 
-# 2. Query: Join sales & exchange_rates to get all sales in USD
+# Query: Join sales & exchange_rates to get all sales in USD
 query_sales_usd = """
-SELECT 
-    s.*, 
-    er.rate, 
+SELECT
+    s.*,
+    er.rate,
     s.sales_amount / er.rate AS sales_amount_usd
 FROM sales s
-JOIN exchange_rates er 
+JOIN exchange_rates er
     ON s.exchange_rate_id = er.id
 """
 
-df_sales = pd.read_sql_query(query_sales_usd, conn)
+# Query: Same as above, restricted to a batch of sampled rowids (primary key lookups only)
+query_sales_usd_by_rowid = """
+SELECT
+    s.rowid AS sample_rowid,
+    s.*,
+    er.rate,
+    s.sales_amount / er.rate AS sales_amount_usd
+FROM sales s
+JOIN exchange_rates er
+    ON s.exchange_rate_id = er.id
+WHERE s.rowid IN ({placeholders})
+"""
 
-# 3. Aggregate by affiliate & category
-agg_aff_cat = (
-    df_sales.groupby(['affiliate_name', 'category'])
-            .agg(total_sales_usd=pd.NamedAgg(column='sales_amount_usd', aggfunc='sum'))
-            .reset_index()
-)
-agg_aff_cat = agg_aff_cat.rename(columns={
-    "affiliate_name": "Affiliate Name",
-    "category": "Category",
-    "total_sales_usd": "Total Sales (USD)"
-})
-agg_aff_cat.to_csv(f"{REPORT_FOLDER}/total_sales_by_affiliate_category.csv", index=False)
-agg_aff_cat["Total Sales (USD)"] = agg_aff_cat["Total Sales (USD)"].round(2)
-
-# 4. Monthly summary
-df_sales['order_month'] = pd.to_datetime(df_sales['order_date']).dt.to_period('M')
-monthly_summary = (
-    df_sales.groupby('order_month')
-        .agg(
-            total_sales_usd=pd.NamedAgg(column='sales_amount_usd', aggfunc='sum'),
-            order_count=pd.NamedAgg(column='order_id', aggfunc='count')
+
+def make_trend_chart(monthly_summary, chart_path, title="Monthly Total Sales (USD)", error_column=None):
+    """
+    Saves the monthly sales trend as a line chart, with error bars if `error_column` is given.
+    """
+    plt.figure(figsize=(8, 4))
+    sns.lineplot(data=monthly_summary, x='Order Month', y='Total Sales (USD)', marker="o")
+    if error_column is not None:
+        plt.errorbar(
+            monthly_summary['Order Month'], monthly_summary['Total Sales (USD)'],
+            yerr=monthly_summary[error_column], fmt="none", capsize=3
         )
-        .reset_index()
-)
-monthly_summary = monthly_summary.rename(columns={
-    "order_month": "Order Month",
-    "total_sales_usd": "Total Sales (USD)",
-    "order_count": "Order Count"
-})
-monthly_summary.to_csv(f"{REPORT_FOLDER}/monthly_sales_summary.csv", index=False)
-monthly_summary['Order Month'] = monthly_summary['Order Month'].astype(str)
-monthly_summary['Total Sales (USD)'] = pd.to_numeric(monthly_summary['Total Sales (USD)'], errors='coerce')
-monthly_summary["Total Sales (USD)"] = monthly_summary["Total Sales (USD)"].round(2)
-
-# 5. Generate trend chart (bar or line plot)
-plt.figure(figsize=(8, 4))
-sns.lineplot(data=monthly_summary, x='Order Month', y='Total Sales (USD)', marker="o")
-plt.title("Monthly Total Sales (USD)")
-plt.xlabel("Month")
-plt.ylabel("Total Sales (USD)")
-plt.tight_layout()
-chart_path = f"{REPORT_FOLDER}/monthly_trend.png"
-plt.savefig(chart_path)
-plt.close()
-
-# 6. Prepare PDF Report
-def make_pdf_report(pdf_path, agg_aff_cat, monthly_summary, chart_path):
+    plt.title(title)
+    plt.xlabel("Month")
+    plt.ylabel("Total Sales (USD)")
+    plt.tight_layout()
+    plt.savefig(chart_path)
+    plt.close()
+
+
+def _table(df, header_color):
+    t = Table([df.columns.tolist()] + df.values.tolist())
+    t.setStyle(TableStyle([
+        ('BACKGROUND', (0,0), (-1,0), header_color),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.black),
+        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
+        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+    ]))
+    return t
+
+
+# Prepare PDF Report
+def make_pdf_report(pdf_path, agg_aff_cat, monthly_summary, chart_path, total_sales, num_orders,
+                    approximate_note=None, top_affiliates=None):
+    """
+    Builds the PDF sales report.
+
+    total_sales and num_orders are shown as given (already formatted).
+    If approximate_note is set, the report is titled and marked as approximate,
+    and top_affiliates (if given) is added as an extra table.
+    """
     doc = SimpleDocTemplate(pdf_path, pagesize=letter)
     styles = getSampleStyleSheet()
     elements = []
 
     # Title & Summary
-    elements.append(Paragraph("Sales Report", styles['Title']))
+    if approximate_note is None:
+        elements.append(Paragraph("Sales Report", styles['Title']))
+    else:
+        elements.append(Paragraph("Sales Report (APPROXIMATE)", styles['Title']))
+        elements.append(Paragraph(f'<font color="red"><b>Approximate figures.</b> {approximate_note}</font>',
+                                  styles['Normal']))
     elements.append(Spacer(1, 12))
 
     # Summary Stats
-    total_sales = agg_aff_cat['Total Sales (USD)'].sum()
-    num_orders = df_sales.shape[0]
-    elements.append(Paragraph(f"<b>Total Sales (USD):</b> {total_sales:,.2f}", styles['Normal']))
+    elements.append(Paragraph(f"<b>Total Sales (USD):</b> {total_sales}", styles['Normal']))
     elements.append(Paragraph(f"<b>Order Count:</b> {num_orders}", styles['Normal']))
     elements.append(Spacer(1, 12))
 
+    # Table: Top affiliates (quick-look mode only)
+    if top_affiliates is not None:
+        elements.append(Paragraph(f"Top {len(top_affiliates)} Affiliates", styles['Heading2']))
+        elements.append(_table(top_affiliates.astype(str), colors.lightgrey))
+        elements.append(Spacer(1, 16))
+
     # Table: Aggregated Sales by Affiliate & Category
     elements.append(Paragraph("Sales by Affiliate and Category", styles['Heading2']))
-    table_data = [agg_aff_cat.columns.tolist()] + agg_aff_cat.values.tolist()
-    t = Table(table_data)
-    t.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.lightgrey),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.black),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-    ]))
-    elements.append(t)
+    elements.append(_table(agg_aff_cat, colors.lightgrey))
     elements.append(Spacer(1, 16))
 
     # Chart
@@ -113,22 +125,242 @@ def make_pdf_report(pdf_path, agg_aff_cat, monthly_summary, chart_path):
 
     # Table: Monthly Summary
     elements.append(Paragraph("Monthly Sales Summary", styles['Heading2']))
-    table_month = [monthly_summary.columns.tolist()] + monthly_summary.astype(str).values.tolist()
-    t2 = Table(table_month)
-    t2.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.lightblue),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.black),
-        ('ALIGN', (0,0), (-1,-1), 'CENTER'),
-        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-    ]))
-    elements.append(t2)
+    elements.append(_table(monthly_summary.astype(str), colors.lightblue))
 
     doc.build(elements)
 
-pdf_path = f"{REPORT_FOLDER}/etl_report.pdf"
-make_pdf_report(pdf_path, agg_aff_cat, monthly_summary, chart_path)
 
-print(f"Reports saved in {REPORT_FOLDER}:")
-print(f"  - total_sales_by_affiliate_category.csv")
-print(f"  - monthly_sales_summary.csv")
-print(f"  - etl_report.pdf")
+def generate_report(conn):
+    """
+    Exact report over the whole `sales` table (CSV summaries, trend chart and PDF).
+    """
+    df_sales = pd.read_sql_query(query_sales_usd, conn)
+
+    # Aggregate by affiliate & category
+    agg_aff_cat = (
+        df_sales.groupby(['affiliate_name', 'category'])
+                .agg(total_sales_usd=pd.NamedAgg(column='sales_amount_usd', aggfunc='sum'))
+                .reset_index()
+    )
+    agg_aff_cat = agg_aff_cat.rename(columns={
+        "affiliate_name": "Affiliate Name",
+        "category": "Category",
+        "total_sales_usd": "Total Sales (USD)"
+    })
+    agg_aff_cat.to_csv(f"{REPORT_FOLDER}/total_sales_by_affiliate_category.csv", index=False)
+    agg_aff_cat["Total Sales (USD)"] = agg_aff_cat["Total Sales (USD)"].round(2)
+
+    # Monthly summary
+    df_sales['order_month'] = pd.to_datetime(df_sales['order_date']).dt.to_period('M')
+    monthly_summary = (
+        df_sales.groupby('order_month')
+            .agg(
+                total_sales_usd=pd.NamedAgg(column='sales_amount_usd', aggfunc='sum'),
+                order_count=pd.NamedAgg(column='order_id', aggfunc='count')
+            )
+            .reset_index()
+    )
+    monthly_summary = monthly_summary.rename(columns={
+        "order_month": "Order Month",
+        "total_sales_usd": "Total Sales (USD)",
+        "order_count": "Order Count"
+    })
+    monthly_summary.to_csv(f"{REPORT_FOLDER}/monthly_sales_summary.csv", index=False)
+    monthly_summary['Order Month'] = monthly_summary['Order Month'].astype(str)
+    monthly_summary['Total Sales (USD)'] = pd.to_numeric(monthly_summary['Total Sales (USD)'], errors='coerce')
+    monthly_summary["Total Sales (USD)"] = monthly_summary["Total Sales (USD)"].round(2)
+
+    # Generate trend chart
+    chart_path = f"{REPORT_FOLDER}/monthly_trend.png"
+    make_trend_chart(monthly_summary, chart_path)
+
+    pdf_path = f"{REPORT_FOLDER}/etl_report.pdf"
+    total_sales = agg_aff_cat['Total Sales (USD)'].sum()
+    make_pdf_report(pdf_path, agg_aff_cat, monthly_summary, chart_path,
+                    f"{total_sales:,.2f}", f"{df_sales.shape[0]}")
+
+    return [
+        "total_sales_by_affiliate_category.csv",
+        "monthly_sales_summary.csv",
+        "etl_report.pdf",
+    ]
+
+
+def sample_sales(conn, sample_size=QUICK_SAMPLE_SIZE, strata=QUICK_STRATA, seed=None):
+    """
+    Draws a stratified random sample of sales (joined with their USD amount) in bounded time.
+
+    The rowid range of `sales` is split into `strata` equally wide strata, which follow load order,
+    and the same number of rowids is drawn from each one. The number of strata is capped at
+    sample_size // 2, so every stratum gets at least two rowids (needed for its variance) and
+    no more than `sample_size` rowids are drawn in total. Only the rowid bounds and the sampled rows
+    are read, so the cost depends on the sample size, not on the table size.
+    Rowids without a (joinable) sale stay in the sample as empty slots; they belong to no group,
+    which keeps the estimates unbiased when rowids have gaps.
+
+    Returns:
+        (sample, strata_sizes): `sample` has one row per drawn rowid with a `stratum` column
+        (sales columns are NaN for empty slots); `strata_sizes` has columns stratum, N (rowids
+        in the stratum) and n (rowids drawn from it).
+
+    Raises:
+        ValueError: If sample_size is smaller than 2.
+    """
+    if sample_size < 2:
+        raise ValueError(f"sample_size must be at least 2, got {sample_size}")
+    rng = random.Random(seed)
+    low, high = conn.execute("SELECT MIN(rowid), MAX(rowid) FROM sales").fetchone()
+    if low is None:
+        return pd.DataFrame(columns=["sample_rowid", "stratum"]), pd.DataFrame(columns=["stratum", "N", "n"])
+
+    population = high - low + 1
+    strata = max(1, min(strata, population, sample_size // 2))
+    per_stratum = sample_size // strata
+    bounds = [low + population * h // strata for h in range(strata + 1)]
+
+    drawn = []
+    sizes = []
+    for h in range(strata):
+        rowids = rng.sample(range(bounds[h], bounds[h + 1]), min(per_stratum, bounds[h + 1] - bounds[h]))
+        drawn.extend((rowid, h) for rowid in rowids)
+        sizes.append((h, bounds[h + 1] - bounds[h], len(rowids)))
+
+    # SQLite limits the number of bound parameters per statement
+    batches = []
+    for start in range(0, len(drawn), 900):
+        rowids = [rowid for rowid, _ in drawn[start:start + 900]]
+        query = query_sales_usd_by_rowid.format(placeholders=", ".join("?" * len(rowids)))
+        batches.append(pd.read_sql_query(query, conn, params=rowids))
+
+    sample = pd.DataFrame(drawn, columns=["sample_rowid", "stratum"]).merge(
+        pd.concat(batches, ignore_index=True), on="sample_rowid", how="left"
+    )
+    return sample, pd.DataFrame(sizes, columns=["stratum", "N", "n"])
+
+
+def estimate_totals(sample, strata_sizes, group_cols, value_col=None, z=QUICK_Z):
+    """
+    Estimates the sum of `value_col` (or the number of sales if None) per group
+    from a stratified sample, using the stratified expansion estimator.
+
+    Returns:
+        pd.DataFrame: group_cols + `estimate` and `error`, the ± z·SE error bound
+        (95% confidence for the default z). Groups absent from the sample are not listed.
+    """
+    rows = sample.dropna(subset=["order_id"]).copy()
+    rows["_all"] = "all"
+    group_cols = list(group_cols) or ["_all"]
+    rows["_y"] = 1.0 if value_col is None else rows[value_col].astype(float)
+    rows["_y2"] = rows["_y"] ** 2
+
+    sums = (
+        rows.groupby(group_cols + ["stratum"])[["_y", "_y2"]].sum()
+            .reset_index()
+            .merge(strata_sizes, on="stratum")
+    )
+    # Per-stratum mean and sample variance, counting every drawn rowid outside the group as 0
+    n = sums["n"].astype(float)
+    big_n = sums["N"].astype(float)
+    mean = sums["_y"] / n
+    variance = ((sums["_y2"] - n * mean ** 2) / (n - 1).clip(lower=1)).clip(lower=0)
+    sums["estimate"] = big_n * mean
+    sums["variance"] = big_n ** 2 * (1 - n / big_n) * variance / n
+
+    totals = sums.groupby(group_cols)[["estimate", "variance"]].sum().reset_index()
+    totals["error"] = z * totals["variance"] ** 0.5
+    totals = totals.drop(columns=["variance"])
+    if group_cols == ["_all"]:
+        totals = totals.drop(columns=["_all"])
+    return totals
+
+
+def generate_quick_report(conn, sample_size=QUICK_SAMPLE_SIZE, seed=None):
+    """
+    Approximate quick-look report: the same summaries as generate_report, estimated from
+    a bounded stratified sample, each figure with a 95% error bound. Outputs are prefixed
+    with `quick_` so they never overwrite the exact report.
+    """
+    sample, strata_sizes = sample_sales(conn, sample_size, seed=seed)
+    rows_sampled = int(sample["order_id"].notna().sum()) if "order_id" in sample else 0
+    if rows_sampled:
+        sample["order_month"] = pd.to_datetime(sample["order_date"]).dt.to_period('M').astype(str)
+    else:
+        sample = pd.DataFrame(columns=["sample_rowid", "stratum", "order_id", "affiliate_name",
+                                       "category", "order_month", "sales_amount_usd"])
+
+    def with_error(group_cols, value_col, name, error_name, decimals):
+        totals = estimate_totals(sample, strata_sizes, group_cols, value_col)
+        totals[["estimate", "error"]] = totals[["estimate", "error"]].round(decimals)
+        if decimals == 0:
+            # Counts are whole numbers: write 1133 and ± 117, not 1133.0
+            totals = totals.astype({"estimate": int, "error": int})
+        return totals.rename(columns={"estimate": name, "error": error_name})
+
+    usd, usd_error = "Total Sales (USD)", "± (USD, 95%)"
+    orders, orders_error = "Order Count", "± (orders, 95%)"
+
+    # Aggregate by affiliate & category
+    agg_aff_cat = with_error(["affiliate_name", "category"], "sales_amount_usd", usd, usd_error, 2)
+    agg_aff_cat = agg_aff_cat.rename(columns={"affiliate_name": "Affiliate Name", "category": "Category"})
+    agg_aff_cat.to_csv(f"{REPORT_FOLDER}/quick_total_sales_by_affiliate_category.csv", index=False)
+
+    # Monthly summary (order_id is the primary key, so the order count is the distinct-order count)
+    monthly_summary = with_error(["order_month"], "sales_amount_usd", usd, usd_error, 2).merge(
+        with_error(["order_month"], None, orders, orders_error, 0), on="order_month", how="outer"
+    ).rename(columns={"order_month": "Order Month"}).sort_values("Order Month")
+    monthly_summary.to_csv(f"{REPORT_FOLDER}/quick_monthly_sales_summary.csv", index=False)
+
+    # Top-K affiliates by estimated sales
+    top_affiliates = (
+        with_error(["affiliate_name"], "sales_amount_usd", usd, usd_error, 2)
+            .rename(columns={"affiliate_name": "Affiliate Name"})
+            .nlargest(TOP_K_AFFILIATES, usd)
+    )
+    top_affiliates.to_csv(f"{REPORT_FOLDER}/quick_top_affiliates.csv", index=False)
+
+    chart_path = f"{REPORT_FOLDER}/quick_monthly_trend.png"
+    make_trend_chart(monthly_summary, chart_path, "Monthly Total Sales (USD), approximate", usd_error)
+
+    total = estimate_totals(sample, strata_sizes, [], "sales_amount_usd")
+    count = estimate_totals(sample, strata_sizes, [], None)
+    total_sales, total_error = (total.iloc[0]["estimate"], total.iloc[0]["error"]) if len(total) else (0, 0)
+    num_orders, orders_bound = (count.iloc[0]["estimate"], count.iloc[0]["error"]) if len(count) else (0, 0)
+
+    note = (
+        f"Estimated from a stratified random sample of {rows_sampled:,} sales "
+        f"({len(sample):,} rowids drawn from {int(strata_sizes['N'].sum()):,}). "
+        "Values after ± are 95% error bounds; groups absent from the sample are not listed."
+    )
+    make_pdf_report(f"{REPORT_FOLDER}/quick_etl_report.pdf", agg_aff_cat, monthly_summary, chart_path,
+                    f"{total_sales:,.2f} ± {total_error:,.2f}", f"{num_orders:,.0f} ± {orders_bound:,.0f}",
+                    approximate_note=note, top_affiliates=top_affiliates)
+
+    return [
+        "quick_total_sales_by_affiliate_category.csv",
+        "quick_monthly_sales_summary.csv",
+        "quick_top_affiliates.csv",
+        "quick_etl_report.pdf",
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the sales CSV and PDF reports.")
+    parser.add_argument("--quick", action="store_true",
+                        help="approximate quick-look report from a bounded stratified sample")
+    parser.add_argument("--sample-size", type=int, default=QUICK_SAMPLE_SIZE,
+                        help="rows sampled in --quick mode")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for --quick mode")
+    args = parser.parse_args()
+    if args.sample_size < 2:
+        parser.error("--sample-size must be at least 2")
+
+    conn = sqlite3.connect(DB_PATH)
+    if args.quick:
+        outputs = generate_quick_report(conn, args.sample_size, args.seed)
+    else:
+        outputs = generate_report(conn)
+    conn.close()
+
+    print(f"Reports saved in {REPORT_FOLDER}:")
+    for output in outputs:
+        print(f"  - {output}")
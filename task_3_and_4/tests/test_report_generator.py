@@ -0,0 +1,100 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from reportlab import rl_config
+
+from task_3_and_4 import report_generator
+from task_3_and_4.report_generator import estimate_totals, query_sales_usd, sample_sales
+
+
+def make_db(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE exchange_rates (id INTEGER PRIMARY KEY, date TEXT, currency TEXT, rate REAL)")
+    conn.execute("""
+        CREATE TABLE sales (
+            order_id INT NOT NULL PRIMARY KEY, affiliate_name TEXT, category TEXT, sales_amount REAL,
+            currency TEXT, order_date TEXT, exchange_rate_id INT
+        )
+    """)
+    conn.executemany("INSERT INTO exchange_rates VALUES (?, ?, ?, ?)", [(1, "2024-01-01", "USD", 1.0),
+                                                                       (2, "2024-02-01", "EUR", 0.5)])
+    rng = np.random.default_rng(0)
+    conn.executemany("INSERT INTO sales VALUES (?, ?, ?, ?, ?, ?, ?)", [
+        (i, f"Affiliate {i % 3}", "Fashion", float(rng.uniform(10, 100)), "USD" if i % 2 else "EUR",
+         "2024-01-01" if i % 2 else "2024-02-01", 1 if i % 2 else 2)
+        for i in range(rows)
+    ])
+    # Leave gaps in the rowid range
+    conn.execute("DELETE FROM sales WHERE order_id % 7 = 0")
+    conn.commit()
+    return conn
+
+
+def exact_totals(conn):
+    df = pd.read_sql_query(query_sales_usd, conn)
+    return df.groupby("affiliate_name")["sales_amount_usd"].sum()
+
+
+def test_quick_estimates_are_exact_when_sample_covers_table(tmp_path):
+    conn = make_db(tmp_path / "sales.db", 200)
+    sample, strata_sizes = sample_sales(conn, sample_size=1_000, seed=1)
+
+    totals = estimate_totals(sample, strata_sizes, ["affiliate_name"], "sales_amount_usd")
+    expected = exact_totals(conn)
+    assert np.allclose(totals.set_index("affiliate_name")["estimate"], expected)
+    assert (totals["error"] == 0).all()
+
+    count = estimate_totals(sample, strata_sizes, [], None)
+    assert count.iloc[0]["estimate"] == len(pd.read_sql_query(query_sales_usd, conn))
+
+
+def test_quick_estimates_fall_within_error_bounds(tmp_path):
+    conn = make_db(tmp_path / "sales.db", 20_000)
+    sample, strata_sizes = sample_sales(conn, sample_size=2_000, seed=1)
+    assert len(sample) <= 2_000
+
+    totals = estimate_totals(sample, strata_sizes, ["affiliate_name"], "sales_amount_usd").set_index("affiliate_name")
+    expected = exact_totals(conn)
+    assert (totals["error"] > 0).all()
+    assert ((totals["estimate"] - expected).abs() <= totals["error"]).all()
+
+
+def test_sample_never_exceeds_requested_size(tmp_path):
+    conn = make_db(tmp_path / "sales.db", 20_000)
+
+    sample, strata_sizes = sample_sales(conn, sample_size=10, seed=1)
+    assert len(sample) == 10
+    assert len(strata_sizes) == 5
+    assert (strata_sizes["n"] >= 2).all()
+
+    with pytest.raises(ValueError):
+        sample_sales(conn, sample_size=1)
+
+
+def test_generate_quick_report_writes_approximate_outputs(tmp_path, monkeypatch):
+    conn = make_db(tmp_path / "sales.db", 2_000)
+    monkeypatch.setattr(report_generator, "REPORT_FOLDER", str(tmp_path))
+    # Uncompressed PDF streams so the report text can be checked
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+
+    outputs = report_generator.generate_quick_report(conn, sample_size=200, seed=1)
+
+    assert all(output.startswith("quick_") for output in outputs)
+    for output in outputs + ["quick_monthly_trend.png"]:
+        assert (tmp_path / output).exists()
+
+    monthly = pd.read_csv(tmp_path / "quick_monthly_sales_summary.csv")
+    assert list(monthly.columns) == ["Order Month", "Total Sales (USD)", "± (USD, 95%)",
+                                     "Order Count", "± (orders, 95%)"]
+    assert list(monthly["Order Month"]) == ["2024-01", "2024-02"]
+    assert (monthly["± (USD, 95%)"] > 0).all()
+    # Estimated counts are written as whole numbers (1133, not 1133.0)
+    assert pd.api.types.is_integer_dtype(monthly["Order Count"])
+    assert pd.api.types.is_integer_dtype(monthly["± (orders, 95%)"])
+    assert len(pd.read_csv(tmp_path / "quick_top_affiliates.csv")) == 3
+
+    pdf = (tmp_path / "quick_etl_report.pdf").read_bytes()
+    assert b"APPROXIMATE" in pdf
+    assert b"Approximate figures." in pdf
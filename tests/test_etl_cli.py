@@ -0,0 +1,86 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TRACKING_FILES = {
+    "task_1": "processed_files_task_one.json",
+    "task_2": "processed_files_task_two.json",
+}
+
+# Runs etl_cli.main in a fresh interpreter and reports which heavy modules it imported
+RUN_CLI = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+import etl_cli
+code = etl_cli.main(sys.argv[1:])
+print("heavy:", sorted(m for m in ("pandas", "requests", "sqlalchemy") if m in sys.modules))
+sys.exit(code)
+"""
+
+# Runs etl_cli.main for task_1 with a sales file still pending. The real run_script is imported
+# first and its rate fetching replaced by conftest.fake_rates, so the ETL succeeds ("ok") or
+# fails ("fail") without network
+RUN_CLI_PENDING = f"""
+import sys
+sys.path.insert(0, {ROOT!r})
+sys.path.insert(0, {os.path.join(ROOT, "task_1")!r})
+import run_script
+from conftest import fake_rates
+
+def fetch_rates_for_date(date_str):
+    if sys.argv[1] == "fail":
+        raise ConnectionError("rates API down")
+    return fake_rates(date_str)
+
+run_script.fetch_rates_for_date = fetch_rates_for_date
+import etl_cli
+sys.exit(etl_cli.main(["task_1"] + sys.argv[2:]))
+"""
+
+def run_cli(cwd, *args):
+    return subprocess.run([sys.executable, "-c", RUN_CLI, *args], cwd=cwd, capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("target", sorted(TRACKING_FILES))
+def test_no_op_run_skips_heavy_imports(tmp_path, target):
+    csv_file = tmp_path / "sales.csv"
+    shutil.copy(os.path.join(ROOT, "task_1", "test_data.csv"), csv_file)
+    (tmp_path / TRACKING_FILES[target]).write_text(json.dumps({"sales.csv": os.path.getmtime(csv_file)}))
+
+    result = run_cli(tmp_path, target, "--csv", str(csv_file))
+
+    assert result.returncode == 0
+    assert "already been processed" in result.stdout
+    assert "heavy: []" in result.stdout
+
+
+def test_missing_sales_file_fails_fast(tmp_path):
+    result = run_cli(tmp_path, "task_1", "--csv", str(tmp_path / "missing.csv"))
+
+    assert result.returncode == 1
+    assert "Sales file not found" in result.stdout
+    assert "heavy: []" in result.stdout
+
+
+@pytest.mark.parametrize("outcome, returncode, message", [
+    ("ok", 0, "ETL completed successfully."),
+    ("fail", 1, "ETL failed: rates API down"),
+])
+def test_pending_run_reports_etl_result(tmp_path, outcome, returncode, message):
+    csv_file = tmp_path / "sales.csv"
+    shutil.copy(os.path.join(ROOT, "task_1", "test_data.csv"), csv_file)
+
+    result = subprocess.run(
+        [sys.executable, "-c", RUN_CLI_PENDING, outcome, "--csv", str(csv_file), "--db", str(tmp_path / "etl.db")],
+        cwd=tmp_path, capture_output=True, text=True
+    )
+
+    assert result.returncode == returncode
+    assert message in result.stdout
+    assert (tmp_path / TRACKING_FILES["task_1"]).exists() == (returncode == 0)